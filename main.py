@@ -3,27 +3,27 @@
 ArXiv Research Assistant - Main Entry Point
 
 This is a convenience wrapper that calls the main CLI application.
-The actual implementation is in src/cli/app.py
+The actual implementation is in src/arxiv_ra/cli/app.py; after `pip install -e .`
+the same CLI is available as the `arxiv-ra` command.
 """
 
 import sys
-import os
 from pathlib import Path
 
-# Add src directory to Python path
-src_path = Path(__file__).parent / "src"
-sys.path.insert(0, str(src_path))
-
 # Import and run the main application
 if __name__ == "__main__":
     try:
-        # Import with proper error handling
-        from cli.app import main  # type: ignore
+        try:
+            import arxiv_ra  # noqa: F401
+        except ImportError:
+            # Not installed as a package: use the source tree
+            sys.path.insert(0, str(Path(__file__).parent / "src"))
+        from arxiv_ra.cli.app import main
         main()
     except ImportError as e:
         print(f"Error importing CLI application: {e}")
-        print("Please ensure the src/cli/app.py file exists and is properly configured.")
-        print("You can also run the CLI directly with: python src/cli/app.py")
+        print("Please ensure the src/arxiv_ra/cli/app.py file exists and is properly configured.")
+        print("You can also install the package with `pip install -e .` and run `arxiv-ra`.")
         sys.exit(1)
     except Exception as e:
         print(f"Error running application: {e}")
@@ -81,6 +81,9 @@ install_dependencies() {
     # Install requirements
     pip install -r requirements.txt
     
+    # Install the package itself (provides the arxiv-ra command)
+    pip install -e .
+    
     print_success "Dependencies installed"
 }
 
@@ -136,7 +139,7 @@ setup_django() {
 validate_setup() {
     print_status "Validating setup..."
     
-    python config/settings.py
+    python main.py validate-config
     
     print_success "Setup validation completed"
 }
@@ -160,7 +163,7 @@ main() {
     echo "Next steps:"
     echo "1. Edit .env file with your API keys"
     echo "2. Add your paper data to the data/ directory"
-    echo "3. Run: python src/storage/faiss_manager.py --input data/embeddings.json"
+    echo "3. Run: python main.py build-index --input data/embeddings.json"
     echo "4. Start the application: python llm-integration/llmproject/manage.py runserver"
     echo
     echo "For Docker deployment: docker-compose up"
@@ -0,0 +1,3 @@
+"""
+ArXiv Research Assistant - AI-powered paper discovery with FAISS, RocksDB and CLIP
+"""
\ No newline at end of file
@@ -7,14 +7,10 @@ in different modes: web server, CLI tool, or data processing pipeline.
 """
 
 import os
-import sys
 import argparse
 from pathlib import Path
 
-# Add src directory to Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from config.settings import config
+from ..config.settings import config, build_env_cache, ENV_FILE, ENV_CACHE_FILE
 
 
 def run_web_server(host="127.0.0.1", port=8000, debug=False):
@@ -49,7 +45,7 @@ def run_web_server(host="127.0.0.1", port=8000, debug=False):
 def run_cli_search(query, search_type="text", k=5, image_path=None):
     """Run CLI-based search"""
     try:
-        from search.search_engine import ArxivSearchEngine  # type: ignore
+        from ..search.search_engine import ArxivSearchEngine
     except ImportError:
         print("❌ Search engine not available. Please ensure the search module is properly configured.")
         return
@@ -60,7 +56,12 @@ def run_cli_search(query, search_type="text", k=5, image_path=None):
     print(f"Results: {k}")
     print("=" * 50)
     
-    engine = ArxivSearchEngine()
+    engine = ArxivSearchEngine(
+        paper_cache_size=config.PAPER_CACHE_SIZE,
+        use_gpu=config.USE_GPU,
+        mmap_index=config.FAISS_MMAP,
+        nprobe=config.FAISS_NPROBE
+    )
     
     if search_type == "text":
         results = engine.search_by_text(query, k)
@@ -86,10 +87,10 @@ def run_cli_search(query, search_type="text", k=5, image_path=None):
         print()
 
 
-def build_index(input_file, output_dir="data"):
+def build_index(input_file, output_dir="data", nlist=None, pq_m=None):
     """Build FAISS index from embeddings file"""
     try:
-        from storage.faiss_manager import build_index_from_json  # type: ignore
+        from ..storage.faiss_manager import build_index_from_json
     except ImportError:
         print("❌ FAISS manager not available. Please ensure the storage module is properly configured.")
         return
@@ -97,14 +98,21 @@ def build_index(input_file, output_dir="data"):
     print(f"🏗️  Building FAISS Index")
     print(f"Input: {input_file}")
     print(f"Output: {output_dir}")
+    print(f"Index type: {config.FAISS_INDEX_TYPE}")
     print("=" * 50)
     
+    nlist = nlist or config.FAISS_NLIST
+    pq_m = pq_m or config.FAISS_PQ_M
+    
     if not Path(input_file).exists():
         print(f"❌ Input file not found: {input_file}")
         return
     
     try:
-        manager = build_index_from_json(input_file, output_dir)
+        manager = build_index_from_json(
+            input_file, output_dir, config.FAISS_INDEX_TYPE,
+            hnsw_m=config.FAISS_HNSW_M, ivf_nlist=nlist, pq_m=pq_m
+        )
         print(f"✅ Index built successfully!")
         print(f"📊 Total vectors: {manager.index.ntotal}")
     except Exception as e:
@@ -114,7 +122,7 @@ def build_index(input_file, output_dir="data"):
 def process_papers(input_file, output_file):
     """Process papers from JSON to embeddings"""
     try:
-        from vectorization.processor import process_json  # type: ignore
+        from ..vectorization.processor import process_json
     except ImportError:
         print("❌ Vectorization processor not available. Please ensure the vectorization module is properly configured.")
         return
@@ -154,6 +162,19 @@ def validate_config():
         print(f"   {key}: {value}")
 
 
+def rebuild_config_cache():
+    """Regenerate the cached parse of the .env file"""
+    print("🗃️  ArXiv Research Assistant - Config Cache")
+    print("=" * 50)
+    
+    if not ENV_FILE.exists():
+        print(f"❌ No .env file found at {ENV_FILE}")
+        return
+    
+    values = build_env_cache()
+    print(f"✅ Cached {len(values)} settings to {ENV_CACHE_FILE}")
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -176,6 +197,9 @@ Examples:
 
   # Validate configuration
   python app.py validate-config
+
+  # Rebuild the cached .env parse
+  python app.py config-cache
         """
     )
     
@@ -196,17 +220,22 @@ Examples:
     
     # Build index command
     build_parser = subparsers.add_parser('build-index', help='Build FAISS index')
-    build_parser.add_argument('--input', '-i', required=True, help='Input embeddings JSON file')
+    build_parser.add_argument('--input', '-i', required=True, help='Input embeddings file (.json or .npz)')
     build_parser.add_argument('--output', '-o', default='data', help='Output directory')
+    build_parser.add_argument('--nlist', type=int, help='ivfpq: number of IVF lists (default: FAISS_NLIST)')
+    build_parser.add_argument('--pq-m', type=int, help='ivfpq: PQ sub-quantizers (default: FAISS_PQ_M)')
     
     # Process papers command
     process_parser = subparsers.add_parser('process', help='Process papers to embeddings')
     process_parser.add_argument('--input', '-i', required=True, help='Input papers JSON file')
-    process_parser.add_argument('--output', '-o', required=True, help='Output embeddings JSON file')
+    process_parser.add_argument('--output', '-o', required=True, help='Output embeddings file (.json, or .npz for binary float32)')
     
     # Validate config command
     subparsers.add_parser('validate-config', help='Validate configuration')
     
+    # Config cache command
+    subparsers.add_parser('config-cache', help='Rebuild the cached .env parse')
+    
     # Parse arguments
     args = parser.parse_args()
     
@@ -221,11 +250,13 @@ Examples:
         elif args.command == 'search':
             run_cli_search(args.query, args.type, args.results, args.image)
         elif args.command == 'build-index':
-            build_index(args.input, args.output)
+            build_index(args.input, args.output, args.nlist, args.pq_m)
         elif args.command == 'process':
             process_papers(args.input, args.output)
         elif args.command == 'validate-config':
             validate_config()
+        elif args.command == 'config-cache':
+            rebuild_config_cache()
     except KeyboardInterrupt:
         print("\n\n👋 Goodbye!")
     except Exception as e:
@@ -0,0 +1,3 @@
+"""
+Configuration package for ArXiv Research Assistant
+"""
\ No newline at end of file
@@ -0,0 +1,317 @@
+"""
+Configuration management for ArXiv Research Assistant
+"""
+import os
+import re
+import json
+from functools import cache
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from dotenv import dotenv_values, find_dotenv
+
+from ..core.fs import ensure_dir
+
+
+def _find_env_file() -> Path:
+    """Locate .env by walking up from the working directory"""
+    found = find_dotenv(usecwd=True)
+    return Path(found) if found else Path.cwd() / ".env"
+
+
+ENV_FILE = _find_env_file()
+ENV_CACHE_FILE = ENV_FILE.with_name(".env.cache.json")
+SCHEMA_FILE = Path(__file__).with_name("schema.json")
+
+
+# Bump when the cached format changes so stale caches are rebuilt
+_ENV_CACHE_VERSION = 3
+
+# POSIX-style ${VAR} / ${VAR:-default} references, as understood by python-dotenv
+_ENV_VARIABLE = re.compile(r"\$\{(?P<name>[^}:]*)(?::-(?P<default>[^}]*))?\}")
+
+
+def _read_env_cache() -> Optional[Dict[str, Optional[str]]]:
+    """Return the cached raw .env values if the cache is newer than .env"""
+    # Plain JSON, never pickle: the cache sits next to whichever .env is found
+    # above the working directory, so loading it must not be able to run code
+    try:
+        if ENV_CACHE_FILE.stat().st_mtime >= ENV_FILE.stat().st_mtime:
+            cached = json.loads(ENV_CACHE_FILE.read_text(encoding="utf-8"))
+            if isinstance(cached, dict) and cached.get("version") == _ENV_CACHE_VERSION:
+                values = cached.get("values")
+                if isinstance(values, dict):
+                    return values
+    except (OSError, ValueError):
+        pass
+    return None
+
+
+def build_env_cache() -> Dict[str, Optional[str]]:
+    """Parse .env and (re)write the cache next to it"""
+    # Cache values uninterpolated: ${VAR} must be expanded against each
+    # process's own environment, not the one that built the cache
+    values = dotenv_values(ENV_FILE, interpolate=False)
+    try:
+        ENV_CACHE_FILE.write_text(
+            json.dumps({"version": _ENV_CACHE_VERSION, "values": values}), encoding="utf-8"
+        )
+    except OSError:
+        # Read-only deployments simply skip the cache
+        pass
+    return values
+
+
+def _expand(value: str, env: Dict[str, str]) -> str:
+    """Expand ${VAR} and ${VAR:-default} references in a .env value"""
+    def resolve(match):
+        result = env.get(match.group("name"), match.group("default"))
+        return result if result is not None else ""
+    return _ENV_VARIABLE.sub(resolve, value)
+
+
+def load_env():
+    """Load .env into the environment without overriding variables already set"""
+    if not ENV_FILE.exists():
+        return
+    
+    values = _read_env_cache()
+    if values is None:
+        values = build_env_cache()
+    
+    # Same precedence as load_dotenv(override=False): variables already in the
+    # environment win over earlier .env entries
+    resolved: Dict[str, str] = {}
+    for key, value in values.items():
+        if value is None:
+            continue
+        resolved[key] = _expand(value, {**resolved, **os.environ})
+        os.environ.setdefault(key, resolved[key])
+
+
+def _env_int(name: str, default: int) -> int:
+    """Read an integer setting, naming it if the value doesn't parse"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"Invalid configuration: {name} must be an integer, got {value!r}") from None
+
+
+def _env_float(name: str, default: float) -> float:
+    """Read a number setting, naming it if the value doesn't parse"""
+    value = os.getenv(name)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        raise ValueError(f"Invalid configuration: {name} must be a number, got {value!r}") from None
+
+
+@cache
+def _schema_validator():
+    """Compile config/schema.json once; None if fastjsonschema isn't installed"""
+    try:
+        import fastjsonschema  # type: ignore
+    except ImportError:
+        print("Warning: fastjsonschema not installed. Skipping configuration schema validation.")
+        return None
+    return fastjsonschema.compile(json.loads(SCHEMA_FILE.read_text()))
+
+
+# Load environment variables from .env file
+load_env()
+
+# Set once ensure_directories has run, so repeated calls are no-ops
+_dirs_ready = False
+
+
+class Config:
+    """Application configuration class"""
+    
+    # Base paths (the project root is wherever .env lives)
+    BASE_DIR = ENV_FILE.parent
+    DATA_DIR = Path(os.getenv("DATA_DIR", "data"))
+    
+    # API Configuration
+    GROQ_API_KEY = os.getenv("GROQ_API_KEY", "")
+    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
+    
+    # Database Configuration
+    FAISS_INDEX_FILE = os.getenv("FAISS_INDEX_FILE", str(DATA_DIR / "faiss_index.idx"))
+    FAISS_MAPPING_FILE = os.getenv("FAISS_MAPPING_FILE", str(DATA_DIR / "embeddings_mapping.npz"))
+    ROCKSDB_PATH = os.getenv("ROCKSDB_PATH", str(DATA_DIR / "rocksdb"))
+    PAPERS_DATA_JSON = os.getenv("PAPERS_DATA_JSON", str(DATA_DIR / "combined_data.json"))
+    FAISS_INDEX_TYPE = os.getenv("FAISS_INDEX_TYPE", "flat").lower()  # flat, hnsw or ivfpq
+    FAISS_HNSW_M = _env_int("FAISS_HNSW_M", 32)
+    FAISS_NLIST = _env_int("FAISS_NLIST", 4096)
+    FAISS_PQ_M = _env_int("FAISS_PQ_M", 64)
+    FAISS_NPROBE = _env_int("FAISS_NPROBE", 16)
+    FAISS_MMAP = os.getenv("FAISS_MMAP", "True").lower() == "true"
+    
+    # Django Configuration
+    DJANGO_SECRET_KEY = os.getenv("DJANGO_SECRET_KEY", "your-secret-key-here")
+    DJANGO_DEBUG = os.getenv("DJANGO_DEBUG", "True").lower() == "true"
+    DJANGO_ALLOWED_HOSTS = os.getenv("DJANGO_ALLOWED_HOSTS", "localhost,127.0.0.1").split(",")
+    
+    # File Storage
+    MEDIA_ROOT = os.getenv("MEDIA_ROOT", "media")
+    MAX_UPLOAD_SIZE = _env_int("MAX_UPLOAD_SIZE", 10485760)  # 10MB
+    
+    # ArXiv Configuration
+    ARXIV_API_URL = os.getenv("ARXIV_API_URL", "http://export.arxiv.org/api/query")
+    DEFAULT_SEARCH_QUERY = os.getenv("DEFAULT_SEARCH_QUERY", "machine learning")
+    MAX_PAPERS_PER_QUERY = _env_int("MAX_PAPERS_PER_QUERY", 100)
+    
+    # Vectorization Configuration
+    CLIP_MODEL_NAME = os.getenv("CLIP_MODEL_NAME", "ViT-B/32")
+    EMBEDDING_DIM = _env_int("EMBEDDING_DIM", 512)
+    BATCH_SIZE = _env_int("BATCH_SIZE", 32)
+    
+    # Search Configuration
+    DEFAULT_SEARCH_RESULTS = _env_int("DEFAULT_SEARCH_RESULTS", 5)
+    MAX_SEARCH_RESULTS = _env_int("MAX_SEARCH_RESULTS", 50)
+    SIMILARITY_THRESHOLD = _env_float("SIMILARITY_THRESHOLD", 0.1)
+    
+    # Logging Configuration
+    LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+    LOG_FILE = os.getenv("LOG_FILE", "logs/app.log")
+    
+    # Performance Configuration
+    NUM_WORKERS = _env_int("NUM_WORKERS", 4)
+    USE_GPU = os.getenv("USE_GPU", "False").lower() == "true"
+    CACHE_TIMEOUT = _env_int("CACHE_TIMEOUT", 3600)
+    PAPER_CACHE_SIZE = _env_int("PAPER_CACHE_SIZE", 10000)
+    
+    # Development Configuration
+    DEV_MODE = os.getenv("DEV_MODE", "True").lower() == "true"
+    SKIP_SSL_VERIFY = os.getenv("SKIP_SSL_VERIFY", "False").lower() == "true"
+    MOCK_APIS = os.getenv("MOCK_APIS", "False").lower() == "true"
+    
+    @classmethod
+    def ensure_directories(cls):
+        """Ensure all required directories exist"""
+        global _dirs_ready
+        if _dirs_ready:
+            return
+        
+        directories = {
+            cls.DATA_DIR.resolve(),
+            Path(cls.MEDIA_ROOT).resolve(),
+            Path(cls.LOG_FILE).parent.resolve(),
+            Path(cls.ROCKSDB_PATH).parent.resolve()
+        }
+        
+        # Creating a child also creates its ancestors, so only
+        # the deepest paths need an explicit call
+        leaves = [d for d in directories if not any(d in other.parents for other in directories)]
+        
+        for directory in sorted(leaves, key=lambda d: len(d.parts)):
+            ensure_dir(directory)
+        
+        _dirs_ready = True
+    
+    @classmethod
+    def as_dict(cls) -> Dict[str, Any]:
+        """Return all settings as JSON-compatible values"""
+        return {
+            key: str(value) if isinstance(value, Path) else value
+            for key, value in vars(cls).items()
+            if key.isupper()
+        }
+    
+    @classmethod
+    def validate_schema(cls):
+        """Check setting types and ranges against config/schema.json"""
+        validator = _schema_validator()
+        if validator is None:
+            return
+        
+        import fastjsonschema  # type: ignore
+        try:
+            validator(cls.as_dict())
+        except fastjsonschema.JsonSchemaValueException as e:
+            raise ValueError(f"Invalid configuration: {e.message}") from e
+    
+    @classmethod
+    def validate_semantic(cls) -> List[str]:
+        """Cross-field checks the schema can't express"""
+        issues = []
+        
+        if cls.DEFAULT_SEARCH_RESULTS > cls.MAX_SEARCH_RESULTS:
+            issues.append(
+                f"DEFAULT_SEARCH_RESULTS ({cls.DEFAULT_SEARCH_RESULTS}) exceeds "
+                f"MAX_SEARCH_RESULTS ({cls.MAX_SEARCH_RESULTS})"
+            )
+        
+        if cls.FAISS_INDEX_TYPE == "ivfpq" and cls.EMBEDDING_DIM % cls.FAISS_PQ_M != 0:
+            issues.append(
+                f"EMBEDDING_DIM ({cls.EMBEDDING_DIM}) must be divisible by "
+                f"FAISS_PQ_M ({cls.FAISS_PQ_M}) for the ivfpq index"
+            )
+        
+        if cls.FAISS_NPROBE > cls.FAISS_NLIST:
+            issues.append(f"FAISS_NPROBE ({cls.FAISS_NPROBE}) exceeds FAISS_NLIST ({cls.FAISS_NLIST})")
+        
+        return issues
+    
+    @classmethod
+    def validate_config(cls) -> Dict[str, Any]:
+        """Validate configuration and return status"""
+        issues = cls.validate_semantic()
+        
+        # Check required API keys
+        if not cls.GROQ_API_KEY and not cls.OPENAI_API_KEY:
+            issues.append("No LLM API key configured (GROQ_API_KEY or OPENAI_API_KEY)")
+        
+        # Check Django secret key
+        if cls.DJANGO_SECRET_KEY == "your-secret-key-here":
+            issues.append("Django secret key not configured (DJANGO_SECRET_KEY)")
+        
+        # Check file paths
+        if not cls.DATA_DIR.exists():
+            issues.append(f"Data directory does not exist: {cls.DATA_DIR}")
+        
+        return {
+            "valid": len(issues) == 0,
+            "issues": issues,
+            "config_summary": {
+                "data_dir": str(cls.DATA_DIR),
+                "has_groq_key": bool(cls.GROQ_API_KEY),
+                "has_openai_key": bool(cls.OPENAI_API_KEY),
+                "debug_mode": cls.DJANGO_DEBUG,
+                "use_gpu": cls.USE_GPU
+            }
+        }
+
+
+# Create singleton instance
+config = Config()
+
+# Fail fast on malformed settings, before any heavy imports happen
+config.validate_schema()
+
+# Ensure directories exist on import
+config.ensure_directories()
+
+
+if __name__ == "__main__":
+    # Configuration validation script
+    validation = config.validate_config()
+    
+    print("Configuration Validation Report")
+    print("=" * 40)
+    print(f"Status: {'✓ Valid' if validation['valid'] else '✗ Issues Found'}")
+    print()
+    
+    if validation['issues']:
+        print("Issues:")
+        for issue in validation['issues']:
+            print(f"  - {issue}")
+        print()
+    
+    print("Configuration Summary:")
+    for key, value in validation['config_summary'].items():
+        print(f"  {key}: {value}")
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Filesystem helpers shared across modules
+"""
+import os
+from pathlib import Path
+from typing import Set, Union
+
+# Directories already created or seen in this process
+_known_dirs: Set[str] = set()
+
+
+def ensure_dir(path: Union[str, Path]):
+    """Create a directory if needed, trying mkdir first instead of stat-then-mkdir"""
+    # Absolute, so a relative path seen before an os.chdir isn't mistaken for this one
+    key = os.path.abspath(os.fspath(path))
+    if key in _known_dirs:
+        return
+    
+    try:
+        os.mkdir(key)
+    except FileExistsError:
+        # Only an existing directory will do, as with mkdir(exist_ok=True)
+        if not os.path.isdir(key):
+            raise
+    except FileNotFoundError:
+        # Missing parents: fall back to creating the whole chain
+        os.makedirs(key, exist_ok=True)
+    
+    _known_dirs.add(key)
@@ -1,5 +1,5 @@
 import json
-from clip_vectorization import process_json
+from ..vectorization.processor import process_json
 
 def lambda_handler(event, context):
     """
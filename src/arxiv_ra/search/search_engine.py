@@ -0,0 +1,233 @@
+"""
+Advanced search functionality for paper similarity and retrieval
+"""
+import os
+import hashlib
+from collections import OrderedDict
+from functools import cache
+from typing import Callable, Dict, List, Any, Optional
+from pathlib import Path
+
+from ..storage.faiss_manager import FAISSManager
+from ..storage.rocksdb_manager import RocksDBManager
+
+
+@cache
+def _clip():
+    """Import the CLIP vectorizer (torch + model weights) on first use"""
+    from ..vectorization import clip_vectorization
+    return clip_vectorization
+
+
+class ArxivSearchEngine:
+    """Main search engine for ArXiv papers using FAISS and RocksDB"""
+    
+    def __init__(self, data_dir: str = "data", paper_cache_size: int = 10000,
+                 query_cache_size: int = 1024, use_gpu: bool = False,
+                 mmap_index: bool = True, nprobe: int = 16):
+        self.data_dir = Path(data_dir)
+        # Query embeddings keyed by a short digest, so repeat queries skip CLIP
+        self.query_cache_size = query_cache_size
+        self._query_cache: "OrderedDict[bytes, List[float]]" = OrderedDict()
+        # The engine only searches, so the index can be memory-mapped read-only
+        self.faiss_manager = FAISSManager(data_dir, nprobe=nprobe, use_gpu=use_gpu, mmap_index=mmap_index)
+        self.rocksdb_manager = RocksDBManager(str(self.data_dir / "rocksdb"), cache_size=paper_cache_size)
+        
+        # Try to load existing indices
+        try:
+            self.faiss_manager.load_index()
+            self.faiss_manager.load_mapping()
+        except FileNotFoundError:
+            print("Warning: No existing FAISS index found. Please build index first.")
+    
+    def search_by_text(self, query: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Search papers by text query"""
+        # Vectorize the query
+        key = self._text_key(query)
+        query_vector = self._cached_vector(key, lambda: _clip().vectorize_text(query))
+        
+        # Search similar embeddings
+        similar_results = self.faiss_manager.search_similar(query_vector, k)
+        
+        # Enrich results with paper metadata
+        return [
+            self._text_result(result, paper_data)
+            for result, paper_data in self._fetch_papers(similar_results)
+            if paper_data
+        ]
+    
+    def search_by_texts(self, queries: List[str], k: int = 5) -> List[List[Dict[str, Any]]]:
+        """Search papers for several text queries with batched encoding, search and lookup"""
+        if not queries:
+            return []
+        
+        # Encode only the queries that aren't cached, in one CLIP batch
+        keys = [self._text_key(query) for query in queries]
+        vectors_by_key = {}
+        for key in keys:
+            if key in self._query_cache:
+                self._query_cache.move_to_end(key)
+                vectors_by_key[key] = self._query_cache[key]
+        
+        missing = list(dict.fromkeys(
+            query for query, key in zip(queries, keys) if key not in vectors_by_key
+        ))
+        if missing:
+            vectors = _clip().vectorize_texts(missing)
+            if vectors is None:
+                raise ValueError("Failed to vectorize text queries")
+            for query, vector in zip(missing, vectors):
+                key = self._text_key(query)
+                vectors_by_key[key] = vector
+                self._remember_vector(key, vector)
+        
+        # Search all queries at once
+        batch_results = self.faiss_manager.search_similar_batch([vectors_by_key[key] for key in keys], k)
+        
+        # Fetch metadata for every hit across all queries in one lookup
+        flat_results = [result for results in batch_results for result in results]
+        pairs = self._fetch_papers(flat_results)
+        
+        enriched_batches = []
+        offset = 0
+        for results in batch_results:
+            enriched_batches.append([
+                self._text_result(result, paper_data)
+                for result, paper_data in pairs[offset:offset + len(results)]
+                if paper_data
+            ])
+            offset += len(results)
+        
+        return enriched_batches
+    
+    def search_by_image(self, image_path: str, k: int = 5) -> List[Dict[str, Any]]:
+        """Search papers by image query"""
+        # Vectorize the image, keyed by content so overwritten files aren't stale
+        with open(image_path, 'rb') as f:
+            key = b"image:" + hashlib.blake2b(f.read(), digest_size=16).digest()
+        query_vector = self._cached_vector(key, lambda: _clip().vectorize_image(image_path))
+        
+        # Search similar embeddings
+        similar_results = self.faiss_manager.search_similar(query_vector, k)
+        
+        # Enrich results with paper metadata
+        enriched_results = []
+        for result, paper_data in self._fetch_papers(similar_results):
+            if paper_data:
+                enriched_result = {
+                    **result,
+                    "title": paper_data.get("title", "Unknown"),
+                    "abstract": paper_data.get("abstract", ""),
+                    "content": self._get_section_content(paper_data, result["section_name"])
+                }
+                enriched_results.append(enriched_result)
+        
+        return enriched_results
+    
+    def search_by_embedding(self, embedding: List[float], k: int = 5) -> List[Dict[str, Any]]:
+        """Search papers by pre-computed embedding"""
+        similar_results = self.faiss_manager.search_similar(embedding, k)
+        
+        # Enrich results with paper metadata
+        enriched_results = []
+        for result, paper_data in self._fetch_papers(similar_results):
+            if paper_data:
+                enriched_result = {
+                    **result,
+                    "title": paper_data.get("title", "Unknown"),
+                    "abstract": paper_data.get("abstract", ""),
+                    "content": self._get_section_content(paper_data, result["section_name"])
+                }
+                enriched_results.append(enriched_result)
+        
+        return enriched_results
+    
+    def _text_key(self, query: str) -> bytes:
+        """Build the query-cache key for a text query"""
+        return b"text:" + hashlib.blake2b(query.encode("utf-8"), digest_size=16).digest()
+    
+    def _text_result(self, result: Dict, paper_data: Dict) -> Dict[str, Any]:
+        """Merge a text search hit with its paper metadata"""
+        return {
+            **result,
+            "title": paper_data.get("title", "Unknown"),
+            "abstract": paper_data.get("abstract", ""),
+            "authors": paper_data.get("authors", []),
+            "url": paper_data.get("url", ""),
+            "content": self._get_section_content(paper_data, result["section_name"])
+        }
+    
+    def _cached_vector(self, key: bytes, compute: Callable[[], Optional[List[float]]]) -> Optional[List[float]]:
+        """Return a cached query embedding or compute and remember it"""
+        if key in self._query_cache:
+            self._query_cache.move_to_end(key)
+            return self._query_cache[key]
+        
+        vector = compute()
+        if vector is not None:
+            self._remember_vector(key, vector)
+        return vector
+    
+    def _remember_vector(self, key: bytes, vector: List[float]):
+        """Add a query embedding to the cache, evicting the least recently used one"""
+        if self.query_cache_size <= 0:
+            return
+        self._query_cache[key] = vector
+        self._query_cache.move_to_end(key)
+        if len(self._query_cache) > self.query_cache_size:
+            self._query_cache.popitem(last=False)
+    
+    def _fetch_papers(self, similar_results: List[Dict]) -> List[tuple]:
+        """Pair each search hit with its paper metadata using one batched lookup"""
+        paper_ids = [result["paper_id"] for result in similar_results]
+        papers = self.rocksdb_manager.get_papers(paper_ids)
+        return list(zip(similar_results, papers))
+    
+    def _get_section_content(self, paper_data: Dict, section_name: str) -> str:
+        """Get content for a specific section"""
+        if section_name == "abstract":
+            return paper_data.get("abstract", "")
+        
+        sections = paper_data.get("sections", {})
+        return sections.get(section_name, "Section not found")
+    
+    def get_paper_details(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Get complete paper details"""
+        return self.rocksdb_manager.get_paper(paper_id)
+    
+    def list_available_papers(self) -> List[str]:
+        """List all available paper IDs"""
+        return self.rocksdb_manager.list_papers()
+    
+    def get_statistics(self) -> Dict[str, Any]:
+        """Get search engine statistics"""
+        stats = {
+            "total_papers": len(self.list_available_papers()),
+            "faiss_vectors": self.faiss_manager.index.ntotal if self.faiss_manager.index else 0,
+            "data_directory": str(self.data_dir)
+        }
+        return stats
+
+
+# Legacy function for backward compatibility
+def search_similar_papers(query_vector: List[float], k: int = 3) -> List[Dict[str, Any]]:
+    """Legacy search function for backward compatibility"""
+    engine = ArxivSearchEngine()
+    return engine.search_by_embedding(query_vector, k)
+
+
+if __name__ == "__main__":
+    # Example usage
+    engine = ArxivSearchEngine()
+    
+    # Test search
+    results = engine.search_by_text("machine learning neural networks", k=3)
+    
+    for i, result in enumerate(results, 1):
+        print(f"Result {i}:")
+        print(f"  Title: {result.get('title', 'Unknown')}")
+        print(f"  Paper ID: {result['paper_id']}")
+        print(f"  Section: {result['section_name']}")
+        print(f"  Similarity: {result['similarity_score']:.3f}")
+        print(f"  Content: {result['content'][:200]}...")
+        print()
\ No newline at end of file
@@ -0,0 +1,477 @@
+"""
+FAISS Index Manager for efficient similarity search
+"""
+import hashlib
+import numpy as np
+import orjson
+import os
+from functools import cache
+from typing import TYPE_CHECKING, Dict, List, Any, Tuple
+from pathlib import Path
+
+from ..core.fs import ensure_dir
+
+if TYPE_CHECKING:
+    import faiss
+
+
+INDEX_TYPES = ("flat", "hnsw", "ivfpq")
+
+# FAISS k-means wants at least this many training points per IVF list
+IVF_MIN_POINTS_PER_LIST = 39
+# ...and samples down to this many, so more training data is wasted
+IVF_MAX_POINTS_PER_LIST = 256
+# Each 8-bit PQ sub-quantizer learns 256 centroids
+PQ_MIN_TRAINING_POINTS = 256
+
+
+@cache
+def _faiss():
+    """Import faiss on first use so importing this module stays cheap"""
+    import faiss
+    return faiss
+
+
+def embedding_id(paper_id: str, section_name: str) -> int:
+    """Stable non-negative 63-bit FAISS id for a paper section"""
+    digest = hashlib.blake2b(f"{paper_id}:{section_name}".encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") & 0x7FFFFFFFFFFFFFFF
+
+
+class FAISSManager:
+    """Manages FAISS index operations for document embeddings
+    
+    Re-adding or removing vectors needs remove_ids, which FAISS does not
+    implement for HNSW graphs or GPU indices; those index types are
+    append-only and must be rebuilt to change existing papers.
+    """
+    
+    def __init__(self, data_dir: str = "data", index_type: str = "flat",
+                 hnsw_m: int = 32, ivf_nlist: int = 4096, pq_m: int = 64, nprobe: int = 16,
+                 use_gpu: bool = False, mmap_index: bool = False):
+        if index_type not in INDEX_TYPES:
+            raise ValueError(f"Unknown index type '{index_type}'. Expected one of {INDEX_TYPES}")
+        self.index_type = index_type
+        self.use_gpu = use_gpu
+        self.mmap_index = mmap_index
+        self.gpu_resources = None
+        self.on_gpu = False
+        self.read_only = False
+        self.legacy = False
+        self.hnsw_m = hnsw_m
+        self.ivf_nlist = ivf_nlist
+        self.pq_m = pq_m
+        self.nprobe = nprobe
+        self.data_dir = Path(data_dir)
+        ensure_dir(self.data_dir)
+        self.index_file = self.data_dir / "faiss_index.idx"
+        self.mapping_file = self.data_dir / "embeddings_mapping.npz"
+        # Written by releases that stored a positional IndexFlatL2
+        self.legacy_mapping_file = self.data_dir / "embeddings_mapping.json"
+        self.index = None
+        # FAISS id -> (paper_id, section_name); the ids themselves live in the index
+        self.id_map: Dict[int, Tuple[str, str]] = {}
+        # ivfpq vectors held back until there are enough to train on
+        self._pending: List[Tuple[np.ndarray, List[Tuple[str, str]]]] = []
+        self._pending_rows = 0
+        
+    def create_index(self, embedding_dim: int, num_training: int = None) -> "faiss.Index":
+        """Create a new FAISS index of the configured type
+        
+        For ivfpq, num_training is the size of the training set; nlist is
+        clamped so every list gets enough points, and corpora too small to
+        train a PQ codebook fall back to a flat index.
+        """
+        # Vectors are L2-normalized, so inner product is cosine similarity
+        faiss = _faiss()
+        index_type = self.index_type
+        if index_type == "ivfpq" and num_training is not None and num_training < PQ_MIN_TRAINING_POINTS:
+            print(f"Warning: {num_training} vectors are too few to train an ivfpq index "
+                  f"(needs {PQ_MIN_TRAINING_POINTS}). Using a flat index.")
+            index_type = "flat"
+        
+        if index_type == "hnsw":
+            index = faiss.IndexHNSWFlat(embedding_dim, self.hnsw_m, faiss.METRIC_INNER_PRODUCT)
+            index.hnsw.efConstruction = 200
+            index.hnsw.efSearch = 64
+        elif index_type == "ivfpq":
+            if embedding_dim % self.pq_m != 0:
+                raise ValueError(f"Embedding dimension {embedding_dim} is not divisible by pq_m={self.pq_m}")
+            nlist = self.ivf_nlist
+            if num_training is not None:
+                nlist = max(1, min(nlist, num_training // IVF_MIN_POINTS_PER_LIST))
+            quantizer = faiss.IndexFlatIP(embedding_dim)
+            index = faiss.IndexIVFPQ(quantizer, embedding_dim, nlist, self.pq_m, 8,
+                                     faiss.METRIC_INNER_PRODUCT)
+            self._set_nprobe(index)
+        else:
+            index = faiss.IndexFlatIP(embedding_dim)
+        
+        # IDMap2 lets us add our own stable ids and remove them again later
+        self.index = self._to_gpu(faiss.IndexIDMap2(index))
+        return self.index
+    
+    def load_index(self) -> "faiss.Index":
+        """Load existing FAISS index from file"""
+        if self.index_file.exists():
+            faiss = _faiss()
+            flags = self._mmap_flags() if self.mmap_index else 0
+            index = faiss.read_index(str(self.index_file), flags)
+            self.read_only = flags != 0
+            # Old indices are addressed by position, so adding or removing would shift every id
+            self.legacy = not isinstance(index, faiss.IndexIDMap)
+            self._set_nprobe(self._base_index(index))
+            self.index = self._to_gpu(index)
+            return self.index
+        else:
+            raise FileNotFoundError(f"FAISS index not found at {self.index_file}")
+    
+    def _mmap_flags(self) -> int:
+        """read_index flags that map the bulk of this index file instead of reading it
+        
+        Mapped vectors stay in the page cache, shared by every process that
+        opens the file, and FAISS cannot modify them.
+        """
+        faiss = _faiss()
+        with open(self.index_file, "rb") as f:
+            header = f.read(41)
+        fourcc = header[:4]
+        if fourcc in (b"IxM2", b"IxMp"):
+            # The IDMap header (fourcc, d, ntotal, 2 dummies, is_trained, metric)
+            # is followed by the wrapped index
+            fourcc = header[37:41]
+        
+        if fourcc.startswith(b"Iw"):
+            # IVF indices can map their inverted lists
+            return faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+        if hasattr(faiss, "IO_FLAG_MMAP_IFC"):
+            # Flat and HNSW indices can map their stored vectors
+            return faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY
+        print("Warning: this FAISS version cannot memory-map flat or HNSW indices. Loading into memory.")
+        return 0
+    
+    def save_index(self):
+        """Save FAISS index to file"""
+        self.flush()
+        if self.index is not None:
+            faiss = _faiss()
+            index = faiss.index_gpu_to_cpu(self.index) if self.on_gpu else self.index
+            faiss.write_index(index, str(self.index_file))
+            print(f"FAISS index saved to {self.index_file}")
+        else:
+            raise ValueError("No index to save. Create or load an index first.")
+    
+    def _to_gpu(self, index: "faiss.Index") -> "faiss.Index":
+        """Move an index onto GPU 0 when GPU search is enabled and available"""
+        if not self.use_gpu:
+            return index
+        
+        faiss = _faiss()
+        if not hasattr(faiss, "StandardGpuResources") or faiss.get_num_gpus() == 0:
+            print("Warning: USE_GPU is set but faiss-gpu or a CUDA device is unavailable. Using CPU index.")
+            return index
+        if isinstance(self._base_index(index), faiss.IndexHNSW):
+            print("Warning: HNSW indices are not supported on GPU. Using CPU index.")
+            return index
+        
+        if self.gpu_resources is None:
+            self.gpu_resources = faiss.StandardGpuResources()
+        self.on_gpu = True
+        return faiss.index_cpu_to_gpu(self.gpu_resources, 0, index)
+    
+    @staticmethod
+    def _base_index(index: "faiss.Index") -> "faiss.Index":
+        """The index wrapped by an IDMap, or the index itself"""
+        faiss = _faiss()
+        return faiss.downcast_index(index.index) if isinstance(index, faiss.IndexIDMap) else index
+    
+    def _set_nprobe(self, index: "faiss.Index"):
+        """Apply the configured nprobe to an IVF index; other index types are left alone"""
+        if isinstance(index, _faiss().IndexIVF):
+            index.nprobe = min(self.nprobe, index.nlist)
+    
+    def _check_writable(self):
+        """Raise if the current index is legacy or was memory-mapped read-only"""
+        if self.legacy:
+            raise ValueError("The FAISS index was built by an older release and is read-only. "
+                             "Rebuild it with build-index to modify it.")
+        if self.read_only:
+            raise ValueError("The FAISS index is memory-mapped and read-only. "
+                             "Load it with mmap_index=False to modify it.")
+    
+    def _check_removable(self):
+        """Raise if the current index cannot remove vectors"""
+        self._check_writable()
+        if self.on_gpu:
+            kind = "GPU"
+        elif isinstance(self._base_index(self.index), _faiss().IndexHNSW):
+            kind = "HNSW"
+        else:
+            return
+        raise ValueError(f"{kind} indices do not support removing vectors. "
+                         f"Rebuild the index to replace or remove papers.")
+    
+    def load_mapping(self) -> Dict[int, Tuple[str, str]]:
+        """Load paper mapping from file, falling back to the legacy JSON mapping"""
+        if self.mapping_file.exists():
+            with np.load(self.mapping_file) as data:
+                ids = data["ids"].tolist()
+                paper_ids = data["paper_ids"].tolist()
+                section_names = data["section_names"].tolist()
+            self.id_map = dict(zip(ids, zip(paper_ids, section_names)))
+            return self.id_map
+        elif self.legacy_mapping_file.exists():
+            # {"<position>": {"paper_id": ..., "section_name": ..., "vector": [...]}}
+            legacy = orjson.loads(self.legacy_mapping_file.read_bytes())
+            self.id_map = {
+                int(position): (entry["paper_id"], entry["section_name"])
+                for position, entry in legacy.items()
+            }
+            return self.id_map
+        else:
+            raise FileNotFoundError(f"Mapping file not found at {self.mapping_file}")
+    
+    def save_mapping(self):
+        """Save paper mapping to file"""
+        # Stored as int64 + fixed-width unicode arrays so loading never needs pickle
+        entries = list(self.id_map.values())
+        np.savez_compressed(
+            self.mapping_file,
+            ids=np.fromiter(self.id_map.keys(), dtype=np.int64, count=len(self.id_map)),
+            paper_ids=np.asarray([paper_id for paper_id, _ in entries], dtype=str),
+            section_names=np.asarray([section_name for _, section_name in entries], dtype=str)
+        )
+        print(f"Mapping saved to {self.mapping_file}")
+    
+    def add_embeddings(self, embeddings_data: Dict[str, Dict[str, List[float]]]):
+        """Add embeddings to FAISS index and create mapping"""
+        # Collect all vectors first so FAISS receives one contiguous matrix
+        vectors = []
+        paper_ids = []
+        section_names = []
+        for paper_id, sections in embeddings_data.items():
+            for section_name, embedding in sections.items():
+                if isinstance(embedding, list):
+                    vectors.append(embedding)
+                    paper_ids.append(paper_id)
+                    section_names.append(section_name)
+        
+        if not vectors:
+            return len(self.id_map)
+        
+        return self.add_vectors(np.asarray(vectors, dtype='float32'), paper_ids, section_names)
+    
+    def add_vectors(self, matrix: np.ndarray, paper_ids, section_names) -> int:
+        """Add an (N, D) embedding matrix whose rows are described by paper_ids/section_names
+        
+        Raises ValueError on a read-only index. Sections already in the
+        index are replaced, which also raises ValueError on HNSW and GPU
+        indices since they cannot remove vectors. An untrained ivfpq
+        index buffers vectors until it has enough to train on; call flush()
+        (save_index and searches do) to train on whatever has arrived.
+        """
+        self._check_writable()
+        # Copy, since normalize_L2 works in place
+        matrix = np.array(matrix, dtype='float32', order='C')
+        if matrix.size == 0:
+            return len(self.id_map)
+        keys = list(zip(map(str, paper_ids), map(str, section_names)))
+        
+        # Also covers an ivfpq index from create_index() that hasn't been trained yet
+        if self.index_type == "ivfpq" and (self.index is None or not self.index.is_trained):
+            _faiss().normalize_L2(matrix)
+            self._pending.append((matrix, keys))
+            self._pending_rows += len(keys)
+            if self._pending_rows >= IVF_MIN_POINTS_PER_LIST * self.ivf_nlist:
+                self.flush()
+            return len(self.id_map)
+        
+        if self.index is None:
+            self.create_index(matrix.shape[1])
+        if self._uses_cosine():
+            _faiss().normalize_L2(matrix)
+        return self._add(matrix, keys)
+    
+    def flush(self):
+        """Create and train a pending ivfpq index, then add the buffered vectors
+        
+        Any untrained index from an earlier create_index() call is empty, so
+        it is replaced by one sized for the buffered training set.
+        """
+        if not self._pending:
+            return
+        
+        matrix = np.concatenate([m for m, _ in self._pending])
+        keys = [key for _, batch in self._pending for key in batch]
+        self._pending, self._pending_rows = [], 0
+        
+        # Buffered vectors are already normalized
+        self.create_index(matrix.shape[1], num_training=len(keys))
+        if not self.index.is_trained:
+            # Train on a random sample rather than whatever happened to come first.
+            # Only an unclamped nlist can leave more rows than k-means would use.
+            sample_size = IVF_MAX_POINTS_PER_LIST * self.ivf_nlist
+            if len(matrix) > sample_size:
+                rng = np.random.default_rng(0)
+                self.index.train(matrix[rng.choice(len(matrix), sample_size, replace=False)])
+            else:
+                self.index.train(matrix)
+        self._add(matrix, keys)
+    
+    def _add(self, matrix: np.ndarray, keys: List[Tuple[str, str]]) -> int:
+        """Add a prepared float32 matrix to the trained index under the ids of keys"""
+        # A section listed twice keeps its latest vector, as it would across batches
+        latest = {key: row for row, key in enumerate(keys)}
+        if len(latest) < len(keys):
+            matrix = matrix[np.fromiter(latest.values(), dtype=np.int64, count=len(latest))]
+            keys = list(latest)
+        
+        ids = np.fromiter((embedding_id(*key) for key in keys), dtype=np.int64, count=len(keys))
+        
+        # Re-adding a section replaces its previous vector instead of duplicating it
+        stale = [int(i) for i in ids if int(i) in self.id_map]
+        if stale:
+            self._check_removable()
+            self.index.remove_ids(np.asarray(stale, dtype=np.int64))
+        
+        self.index.add_with_ids(matrix, ids)
+        self.id_map.update(zip(ids.tolist(), keys))
+        
+        return len(self.id_map)
+    
+    def remove_paper(self, paper_id: str) -> int:
+        """Remove every section of a paper from the index; returns the number removed
+        
+        Raises ValueError on memory-mapped, HNSW and GPU indices, which cannot
+        remove vectors.
+        """
+        self.flush()
+        ids = [i for i, (pid, _) in self.id_map.items() if pid == paper_id]
+        if ids:
+            self._check_removable()
+            self.index.remove_ids(np.asarray(ids, dtype=np.int64))
+            for i in ids:
+                del self.id_map[i]
+        return len(ids)
+    
+    def search_similar(self, query_vector: List[float], k: int = 5) -> List[Dict]:
+        """Search for similar embeddings"""
+        query_vector = np.asarray(query_vector, dtype='float32').reshape(1, -1)
+        return self.search_similar_batch(query_vector, k)[0]
+    
+    def search_similar_batch(self, query_vectors: np.ndarray, k: int = 5) -> List[List[Dict]]:
+        """Search several (B, D) query embeddings with a single index.search call"""
+        self.flush()
+        if self.index is None:
+            self.load_index()
+        
+        if not self.id_map:
+            self.load_mapping()
+        
+        # Copy, since normalize_L2 works in place
+        query_vectors = np.array(query_vectors, dtype='float32', order='C', ndmin=2)
+        cosine = self._uses_cosine()
+        if cosine:
+            _faiss().normalize_L2(query_vectors)
+        distances, indices = self.index.search(query_vectors, k)
+        
+        batch_results = []
+        for row_distances, row_indices in zip(distances, indices):
+            results = []
+            for distance, idx in zip(row_distances.tolist(), row_indices.tolist()):
+                meta = self.id_map.get(idx)
+                if meta is not None:
+                    if cosine:
+                        similarity = float(distance)
+                        distance = 1.0 - similarity
+                    else:
+                        # Legacy IndexFlatL2 indices (embeddings_mapping.json) return L2 distances
+                        distance = float(distance)
+                        similarity = 1.0 / (1.0 + distance)
+                    results.append({
+                        "paper_id": meta[0],
+                        "section_name": meta[1],
+                        "distance": distance,
+                        "similarity_score": similarity
+                    })
+            batch_results.append(results)
+        
+        return batch_results
+    
+    def _uses_cosine(self) -> bool:
+        """Whether the current index scores by inner product over normalized vectors"""
+        return self.index.metric_type == _faiss().METRIC_INNER_PRODUCT
+
+
+def _add_embeddings_streaming(manager: FAISSManager, json_file: str, batch_size: int):
+    """Feed a {paper_id: {section: vector}} JSON file to the index in fixed-size batches"""
+    try:
+        import ijson  # type: ignore
+    except ImportError:
+        print("Warning: ijson not installed. Loading the whole embeddings file into memory.")
+        manager.add_embeddings(orjson.loads(Path(json_file).read_bytes()))
+        return
+    
+    buffer = None
+    paper_ids: List[str] = []
+    section_names: List[str] = []
+    
+    with open(json_file, 'rb') as f:
+        for paper_id, sections in ijson.kvitems(f, '', use_float=True):
+            for section_name, embedding in sections.items():
+                if not isinstance(embedding, list):
+                    continue
+                if buffer is None:
+                    buffer = np.empty((batch_size, len(embedding)), dtype='float32')
+                
+                buffer[len(paper_ids)] = embedding
+                paper_ids.append(paper_id)
+                section_names.append(section_name)
+                
+                if len(paper_ids) == batch_size:
+                    manager.add_vectors(buffer, paper_ids, section_names)
+                    paper_ids, section_names = [], []
+    
+    if paper_ids:
+        manager.add_vectors(buffer[:len(paper_ids)], paper_ids, section_names)
+
+
+def build_index_from_json(json_file: str, output_dir: str = "data",
+                          index_type: str = "flat", batch_size: int = 10000,
+                          hnsw_m: int = 32, ivf_nlist: int = 4096, pq_m: int = 64) -> FAISSManager:
+    """Build FAISS index from a JSON or .npz embeddings file"""
+    manager = FAISSManager(output_dir, index_type=index_type,
+                           hnsw_m=hnsw_m, ivf_nlist=ivf_nlist, pq_m=pq_m)
+    
+    if json_file.endswith(".npz"):
+        # Binary output of process_json: one float32 matrix plus row labels
+        with np.load(json_file) as data:
+            manager.add_vectors(data["embeddings"], data["paper_ids"], data["section_names"])
+    else:
+        _add_embeddings_streaming(manager, json_file, batch_size)
+    
+    manager.flush()
+    if manager.index is None:
+        raise ValueError(f"No embeddings found in {json_file}")
+    
+    manager.save_index()
+    manager.save_mapping()
+    
+    return manager
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Build FAISS index from embeddings")
+    parser.add_argument("--input", "-i", required=True, help="Input JSON or .npz file with embeddings")
+    parser.add_argument("--output", "-o", default="data", help="Output directory for index files")
+    parser.add_argument("--index-type", "-t", choices=INDEX_TYPES, default="flat", help="FAISS index type")
+    parser.add_argument("--nlist", type=int, default=4096, help="ivfpq: number of IVF lists (clamped to the corpus size)")
+    parser.add_argument("--pq-m", type=int, default=64, help="ivfpq: PQ sub-quantizers (must divide the embedding dimension)")
+    
+    args = parser.parse_args()
+    
+    manager = build_index_from_json(args.input, args.output, args.index_type,
+                                    ivf_nlist=args.nlist, pq_m=args.pq_m)
+    print(f"FAISS index built successfully with {manager.index.ntotal} vectors")
\ No newline at end of file
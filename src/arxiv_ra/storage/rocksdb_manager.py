@@ -0,0 +1,182 @@
+"""
+RocksDB Manager for fast key-value storage of paper metadata
+"""
+import os
+import sqlite3
+import threading
+import orjson
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional
+from pathlib import Path
+
+from ..core.fs import ensure_dir
+
+
+class RocksDBManager:
+    """Manages RocksDB operations for paper metadata storage
+    
+    Safe to share between threads: one lock covers the cache together with
+    the store, so a reader can't re-cache a value a writer is replacing.
+    """
+    
+    def __init__(self, db_path: str = "data/rocksdb", cache_size: int = 10000):
+        self.db_path = Path(db_path)
+        ensure_dir(self.db_path.parent)
+        self.db = None
+        self.sql = None
+        # LRU of encoded papers; hot papers skip the store read. Entries are
+        # immutable bytes, so handing out a decoded copy can't corrupt them
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, bytes]" = OrderedDict()
+        self._lock = threading.RLock()
+        self._connect()
+    
+    def _connect(self):
+        """Connect to RocksDB"""
+        try:
+            from rocksdict import Rdict  # type: ignore
+            self.db = Rdict(str(self.db_path))
+        except ImportError:
+            print("Warning: rocksdict not installed. Using SQLite storage as fallback.")
+            self.db = None
+            self.sql = sqlite3.connect(str(self.db_path.with_suffix(".sqlite")), check_same_thread=False)
+            self.sql.execute("CREATE TABLE IF NOT EXISTS papers (id TEXT PRIMARY KEY, data BLOB)")
+            self.sql.commit()
+    
+    def store_paper(self, paper_id: str, paper_data: Dict[str, Any]):
+        """Store paper metadata"""
+        with self._lock:
+            self._cache.pop(paper_id, None)
+            if self.db is not None:
+                self.db[paper_id] = orjson.dumps(paper_data)
+            else:
+                with self.sql:
+                    self.sql.execute(
+                        "INSERT OR REPLACE INTO papers (id, data) VALUES (?, ?)",
+                        (paper_id, orjson.dumps(paper_data))
+                    )
+    
+    def get_paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Retrieve paper metadata"""
+        with self._lock:
+            if paper_id in self._cache:
+                self._cache.move_to_end(paper_id)
+                raw = self._cache[paper_id]
+            else:
+                raw = self._read_paper(paper_id)
+                self._cache_put(paper_id, raw)
+        
+        # Decode on every call so callers never share (and mutate) a cached dict
+        return orjson.loads(raw) if raw else None
+    
+    def get_papers(self, paper_ids: List[str]) -> List[Optional[Dict[str, Any]]]:
+        """Retrieve metadata for several papers in one batched lookup"""
+        with self._lock:
+            found = {}
+            missing = []
+            for paper_id in paper_ids:
+                if paper_id in self._cache:
+                    self._cache.move_to_end(paper_id)
+                    found[paper_id] = self._cache[paper_id]
+                elif paper_id not in found:
+                    found[paper_id] = None
+                    missing.append(paper_id)
+            
+            if missing:
+                for paper_id, raw in zip(missing, self._read_papers(missing)):
+                    found[paper_id] = raw
+                    self._cache_put(paper_id, raw)
+        
+        return [orjson.loads(found[paper_id]) if found[paper_id] else None for paper_id in paper_ids]
+    
+    def _read_paper(self, paper_id: str) -> Optional[bytes]:
+        """Read a paper's encoded metadata from the backing store, bypassing the cache"""
+        if self.db is not None:
+            return self.db.get(paper_id)
+        else:
+            row = self.sql.execute("SELECT data FROM papers WHERE id = ?", (paper_id,)).fetchone()
+            return row[0] if row else None
+    
+    def _read_papers(self, paper_ids: List[str]) -> List[Optional[bytes]]:
+        """Read several papers' encoded metadata from the backing store, bypassing the cache"""
+        if self.db is not None:
+            # rocksdict turns a list key into a single multi-get
+            return self.db[list(paper_ids)]
+        else:
+            rows = {}
+            # Stay under SQLite's default bound-parameter limit
+            for start in range(0, len(paper_ids), 500):
+                chunk = paper_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows.update(self.sql.execute(
+                    f"SELECT id, data FROM papers WHERE id IN ({placeholders})", chunk
+                ))
+            return [rows.get(paper_id) for paper_id in paper_ids]
+    
+    def _cache_put(self, paper_id: str, raw: Optional[bytes]):
+        """Remember a paper, evicting the least recently used entry when full"""
+        if not raw or self.cache_size <= 0:
+            return
+        self._cache[paper_id] = raw
+        self._cache.move_to_end(paper_id)
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+    
+    def store_multiple(self, papers_data: Dict[str, Dict[str, Any]]):
+        """Store multiple papers"""
+        with self._lock:
+            if self.db is not None:
+                for paper_id, paper_data in papers_data.items():
+                    self.store_paper(paper_id, paper_data)
+                return
+            
+            for paper_id in papers_data:
+                self._cache.pop(paper_id, None)
+            # One transaction for the whole batch instead of a commit per paper
+            with self.sql:
+                self.sql.executemany(
+                    "INSERT OR REPLACE INTO papers (id, data) VALUES (?, ?)",
+                    ((paper_id, orjson.dumps(paper_data)) for paper_id, paper_data in papers_data.items())
+                )
+    
+    def list_papers(self):
+        """List all stored paper IDs"""
+        with self._lock:
+            if self.db is not None:
+                return list(self.db.keys())
+            else:
+                return [row[0] for row in self.sql.execute("SELECT id FROM papers")]
+    
+    def close(self):
+        """Close the database connection"""
+        with self._lock:
+            self._cache.clear()
+            if self.db is not None:
+                self.db.close()
+            if self.sql is not None:
+                self.sql.close()
+
+
+def load_papers_from_json(json_file: str, db_path: str = "data/rocksdb") -> RocksDBManager:
+    """Load papers from JSON file into RocksDB"""
+    manager = RocksDBManager(db_path)
+    
+    papers_data = orjson.loads(Path(json_file).read_bytes())
+    
+    manager.store_multiple(papers_data)
+    print(f"Loaded {len(papers_data)} papers into RocksDB")
+    
+    return manager
+
+
+if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Load papers into RocksDB")
+    parser.add_argument("--input", "-i", required=True, help="Input JSON file with papers")
+    parser.add_argument("--db", "-d", default="data/rocksdb", help="RocksDB path")
+    
+    args = parser.parse_args()
+    
+    manager = load_papers_from_json(args.input, args.db)
+    print(f"RocksDB initialized with {len(manager.list_papers())} papers")
\ No newline at end of file
@@ -30,6 +30,25 @@ def vectorize_text(input_text):
         print(f"Error processing text: {e}")
         return None
 
+def vectorize_texts(input_texts):
+    """
+    Converts several text strings into embeddings with one batched CLIP forward pass.
+
+    Args:
+        input_texts (list): Input text strings to be vectorized.
+
+    Returns:
+        list: One embedding (as a list) per input text.
+    """
+    try:
+        inputs = clip_processor(text=list(input_texts), return_tensors="pt", padding=True, truncation=True)
+        with torch.no_grad():
+            text_embeddings = clip_model.get_text_features(**inputs)
+        return text_embeddings.numpy().tolist()
+    except Exception as e:
+        print(f"Error processing texts: {e}")
+        return None
+
 def vectorize_image(image_path):
     """
     Converts an image into an embedding using the CLIP model.
@@ -50,8 +69,4 @@ def vectorize_image(image_path):
         return image_embedding
     except Exception as e:
         print(f"Error processing image at {image_path}: {e}")
-        return None
-
-
-s = "My Name is Chandu"
-vectorize_text(s)
\ No newline at end of file
+        return None
\ No newline at end of file
@@ -3,7 +3,8 @@ import os
 import shutil
 import requests
 import argparse
-from clip_vectorization import vectorize_text, vectorize_image
+import numpy as np
+from .clip_vectorization import vectorize_text, vectorize_image
 
 
 def download_from_google_drive(google_drive_url, destination_path):
@@ -36,6 +37,58 @@ def download_from_google_drive(google_drive_url, destination_path):
         return False
 
 
+def load_embeddings(path):
+    """
+    Loads consolidated embeddings from a JSON or .npz file.
+
+    Args:
+        path (str): Path to a JSON file or an .npz archive written by save_embeddings.
+
+    Returns:
+        dict: Mapping of paper id to {section name: embedding}.
+    """
+    if path.endswith(".npz"):
+        embeddings = {}
+        with np.load(path) as data:
+            for paper_id, section_name, vector in zip(data["paper_ids"], data["section_names"], data["embeddings"]):
+                embeddings.setdefault(str(paper_id), {})[str(section_name)] = vector.tolist()
+        return embeddings
+
+    with open(path, 'r') as infile:
+        return json.load(infile)
+
+
+def save_embeddings(embeddings, path):
+    """
+    Saves consolidated embeddings as JSON, or as one float32 matrix when the path ends in .npz.
+
+    Args:
+        embeddings (dict): Mapping of paper id to {section name: embedding}.
+        path (str): Output path.
+    """
+    if not path.endswith(".npz"):
+        with open(path, 'w') as outfile:
+            json.dump(embeddings, outfile, indent=4)
+        return
+
+    vectors, paper_ids, section_names = [], [], []
+    for paper_id, sections in embeddings.items():
+        for section_name, vector in sections.items():
+            if vector is not None:
+                vectors.append(vector)
+                paper_ids.append(paper_id)
+                section_names.append(section_name)
+
+    # Keep the matrix 2-D even when there is nothing to store
+    matrix = np.asarray(vectors, dtype=np.float32) if vectors else np.empty((0, 0), dtype=np.float32)
+    np.savez(
+        path,
+        embeddings=matrix,
+        paper_ids=np.asarray(paper_ids, dtype=str),
+        section_names=np.asarray(section_names, dtype=str)
+    )
+
+
 def process_json(input_json, output_json):
     print("=" * 50)
     download_folder = "downloaded_images"
@@ -43,8 +96,7 @@ def process_json(input_json, output_json):
 
     # Load existing data from the consolidated output file if it exists
     if os.path.exists(output_json):
-        with open(output_json, 'r') as outfile:
-            consolidated_embeddings = json.load(outfile)
+        consolidated_embeddings = load_embeddings(output_json)
     else:
         consolidated_embeddings = {}
 
@@ -110,8 +162,7 @@ def process_json(input_json, output_json):
         consolidated_embeddings[paper_key] = paper_embeddings
 
     # Save the consolidated embeddings to the output JSON file
-    with open(output_json, 'w') as outfile:
-        json.dump(consolidated_embeddings, outfile, indent=4)
+    save_embeddings(consolidated_embeddings, output_json)
     print(f"Updated consolidated embeddings saved to {output_json}")
 
     # Clean up the downloaded_images folder
@@ -122,7 +173,7 @@ def process_json(input_json, output_json):
 def main():
     parser = argparse.ArgumentParser(description="Process an input JSON file and append to a consolidated output.")
     parser.add_argument("input_json", help="Path to the input JSON file.")
-    parser.add_argument("output_json", help="Path to the consolidated output JSON file.")
+    parser.add_argument("output_json", help="Path to the consolidated output file (.json, or .npz for a binary float32 matrix).")
     args = parser.parse_args()
     
     process_json(args.input_json, args.output_json)
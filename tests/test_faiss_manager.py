@@ -0,0 +1,305 @@
+"""
+Tests for FAISSManager's id mapping, streaming build and index-type limits
+"""
+import json
+
+import pytest
+
+np = pytest.importorskip("numpy")
+faiss = pytest.importorskip("faiss")
+
+from arxiv_ra.storage.faiss_manager import (
+    FAISSManager, _add_embeddings_streaming, build_index_from_json, embedding_id
+)
+
+
+def vectors(n, dim=16, seed=0):
+    return np.random.default_rng(seed).standard_normal((n, dim)).astype("float32")
+
+
+def filled(tmp_path, index_type="flat", n=10, **kwargs):
+    manager = FAISSManager(str(tmp_path), index_type=index_type, **kwargs)
+    manager.add_vectors(vectors(n), [f"p{i}" for i in range(n)], ["abstract"] * n)
+    return manager
+
+
+class RecordingManager:
+    """Stands in for FAISSManager and records every add_vectors batch"""
+
+    def __init__(self):
+        self.batches = []
+
+    def add_vectors(self, matrix, paper_ids, section_names):
+        # The streaming buffer is reused between batches, so keep a copy
+        self.batches.append((matrix.copy(), list(paper_ids), list(section_names)))
+
+
+def test_mapping_round_trip(tmp_path):
+    manager = filled(tmp_path)
+    manager.save_mapping()
+
+    loaded = FAISSManager(str(tmp_path)).load_mapping()
+
+    assert loaded == manager.id_map
+
+
+def test_legacy_json_index_still_searches(tmp_path):
+    # What older releases wrote: a positional IndexFlatL2 plus a JSON mapping
+    data = vectors(3)
+    index = faiss.IndexFlatL2(16)
+    index.add(data)
+    faiss.write_index(index, str(tmp_path / "faiss_index.idx"))
+    (tmp_path / "embeddings_mapping.json").write_text(json.dumps({
+        str(i): {"paper_id": f"p{i}", "section_name": "abstract", "vector": row.tolist()}
+        for i, row in enumerate(data)
+    }))
+
+    manager = FAISSManager(str(tmp_path))
+    manager.load_index()
+    assert manager.load_mapping() == {i: (f"p{i}", "abstract") for i in range(3)}
+
+    best = manager.search_similar(data[1], k=1)[0]
+    assert best["paper_id"] == "p1"
+    assert best["similarity_score"] == pytest.approx(1.0 / (1.0 + best["distance"]))
+    with pytest.raises(ValueError, match="older release"):
+        manager.add_vectors(vectors(1), ["new"], ["abstract"])
+
+
+def test_mapping_uses_hashed_ids(tmp_path):
+    manager = filled(tmp_path)
+
+    assert manager.id_map[embedding_id("p3", "abstract")] == ("p3", "abstract")
+    assert embedding_id("p3", "abstract") == embedding_id("p3", "abstract")
+    assert 0 <= embedding_id("p3", "abstract") < 2 ** 63
+
+
+def test_readding_a_section_replaces_it(tmp_path):
+    manager = filled(tmp_path)
+    manager.add_vectors(vectors(1, seed=1), ["p0"], ["abstract"])
+
+    assert manager.index.ntotal == 10
+    assert manager.remove_paper("p0") == 1
+    assert manager.index.ntotal == 9
+
+
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_duplicate_section_in_one_batch_keeps_latest(tmp_path, index_type):
+    manager = FAISSManager(str(tmp_path), index_type=index_type)
+    data = vectors(2)
+    manager.add_vectors(data, ["p", "p"], ["abstract", "abstract"])
+
+    assert manager.index.ntotal == 1
+    assert len(manager.id_map) == 1
+    assert manager.search_similar(data[1], k=2)[0]["distance"] == pytest.approx(0.0, abs=1e-5)
+
+
+def test_hnsw_rejects_removal(tmp_path):
+    manager = filled(tmp_path, "hnsw")
+
+    with pytest.raises(ValueError, match="HNSW"):
+        manager.remove_paper("p0")
+    with pytest.raises(ValueError, match="HNSW"):
+        manager.add_vectors(vectors(1), ["p0"], ["abstract"])
+    assert manager.index.ntotal == 10
+
+
+def test_ivfpq_small_corpus_falls_back_to_flat(tmp_path):
+    manager = filled(tmp_path, "ivfpq", n=50, pq_m=4)
+    manager.flush()
+
+    assert isinstance(manager._base_index(manager.index), faiss.IndexFlat)
+    assert manager.search_similar(vectors(50)[7], k=1)[0]["paper_id"] == "p7"
+
+
+def test_ivfpq_clamps_nlist_and_sets_nprobe(tmp_path):
+    manager = filled(tmp_path, "ivfpq", n=1000, ivf_nlist=4096, pq_m=4, nprobe=8)
+    manager.save_index()
+
+    base = manager._base_index(manager.index)
+    assert base.nlist == 1000 // 39
+    assert base.nprobe == 8
+    assert manager.index.ntotal == 1000
+
+    reloaded = FAISSManager(str(tmp_path), nprobe=4)
+    reloaded.load_index()
+    assert reloaded._base_index(reloaded.index).nprobe == 4
+
+
+def test_ivfpq_trains_across_batches(tmp_path):
+    manager = FAISSManager(str(tmp_path), index_type="ivfpq", ivf_nlist=8, pq_m=4)
+    data = vectors(400)
+    for start in range(0, 400, 100):
+        manager.add_vectors(data[start:start + 100], [f"p{i}" for i in range(start, start + 100)],
+                            ["abstract"] * 100)
+        # 39 * 8 = 312 vectors are needed before training
+        assert (manager.index is not None) == (start + 100 >= 312)
+
+    assert manager._base_index(manager.index).nlist == 8
+    assert manager.index.ntotal == 400
+
+
+def test_ivfpq_buffers_after_explicit_create_index(tmp_path):
+    manager = FAISSManager(str(tmp_path), index_type="ivfpq", ivf_nlist=8, pq_m=4)
+    manager.create_index(16)
+    manager.add_vectors(vectors(300), [f"p{i}" for i in range(300)], ["abstract"] * 300)
+
+    assert manager.search_similar(vectors(300)[42], k=1)[0]["paper_id"] == "p42"
+    assert manager.index.is_trained
+    assert manager.index.ntotal == 300
+
+
+def test_batch_search_matches_single_searches(tmp_path):
+    manager = filled(tmp_path)
+    queries = vectors(4, seed=3)
+
+    batch = manager.search_similar_batch(queries, k=3)
+
+    assert len(batch) == 4
+    assert batch == [manager.search_similar(query, k=3) for query in queries]
+
+
+def test_batch_search_drops_missing_hits_per_row(tmp_path):
+    manager = filled(tmp_path, n=2)
+
+    batch = manager.search_similar_batch(vectors(3, seed=4), k=5)
+
+    assert [len(results) for results in batch] == [2, 2, 2]
+
+
+def test_scores_are_cosine_similarity(tmp_path):
+    data = vectors(5)
+    manager = FAISSManager(str(tmp_path))
+    manager.add_vectors(data * 10, [f"p{i}" for i in range(5)], ["abstract"] * 5)
+    query = vectors(1, seed=5)[0]
+
+    results = manager.search_similar(query * 3, k=5)
+
+    unit = data / np.linalg.norm(data, axis=1, keepdims=True)
+    expected = unit @ (query / np.linalg.norm(query))
+    for result in results:
+        similarity = expected[int(result["paper_id"][1:])]
+        assert result["similarity_score"] == pytest.approx(similarity, abs=1e-5)
+        assert result["distance"] == pytest.approx(1.0 - similarity, abs=1e-5)
+    assert [r["similarity_score"] for r in results] == pytest.approx(sorted(expected, reverse=True), abs=1e-5)
+    assert manager.search_similar(data[2], k=1)[0]["similarity_score"] == pytest.approx(1.0, abs=1e-5)
+
+
+def test_inputs_are_not_normalized_in_place(tmp_path):
+    data = vectors(3) * 10
+    original = data.copy()
+    manager = FAISSManager(str(tmp_path))
+
+    manager.add_vectors(data, ["a", "b", "c"], ["abstract"] * 3)
+    manager.search_similar_batch(data, k=1)
+
+    assert np.array_equal(data, original)
+
+
+def test_streaming_splits_into_batches(tmp_path):
+    pytest.importorskip("ijson")
+    data = {
+        "p1": {"abstract": [1.0, 0.0], "intro": [2.0, 0.0], "title": None},
+        "p2": {"abstract": [3.0, 0.0], "intro": [4.0, 0.0]},
+        "p3": {"abstract": [5.0, 0.0], "intro": [6.0, 0.0], "outro": [7.0, 0.0]},
+    }
+    json_file = tmp_path / "embeddings.json"
+    json_file.write_text(json.dumps(data))
+
+    manager = RecordingManager()
+    _add_embeddings_streaming(manager, str(json_file), batch_size=3)
+
+    assert [len(ids) for _, ids, _ in manager.batches] == [3, 3, 1]
+    matrices = [matrix for matrix, _, _ in manager.batches]
+    assert np.concatenate(matrices)[:, 0].tolist() == [1, 2, 3, 4, 5, 6, 7]
+    assert manager.batches[0][1:] == (["p1", "p1", "p2"], ["abstract", "intro", "abstract"])
+    assert manager.batches[2][1:] == (["p3"], ["outro"])
+
+
+def test_streaming_exact_multiple_has_no_empty_tail(tmp_path):
+    pytest.importorskip("ijson")
+    json_file = tmp_path / "embeddings.json"
+    json_file.write_text(json.dumps({f"p{i}": {"abstract": [float(i)]} for i in range(4)}))
+
+    manager = RecordingManager()
+    _add_embeddings_streaming(manager, str(json_file), batch_size=2)
+
+    assert [len(ids) for _, ids, _ in manager.batches] == [2, 2]
+
+
+def test_streamed_build_indexes_every_vector(tmp_path):
+    pytest.importorskip("ijson")
+    data = vectors(7)
+    json_file = tmp_path / "embeddings.json"
+    json_file.write_text(json.dumps({f"p{i}": {"abstract": row.tolist()} for i, row in enumerate(data)}))
+
+    manager = build_index_from_json(str(json_file), str(tmp_path / "out"), batch_size=3)
+
+    assert manager.index.ntotal == 7
+    assert manager.search_similar(data[6], k=1)[0]["paper_id"] == "p6"
+
+
+def test_build_without_embeddings_raises(tmp_path):
+    json_file = tmp_path / "embeddings.json"
+    json_file.write_text(json.dumps({"p1": {"abstract": None}}))
+
+    with pytest.raises(ValueError, match="No embeddings found"):
+        build_index_from_json(str(json_file), str(tmp_path / "out"))
+
+
+@pytest.mark.parametrize("empty", [np.empty((0, 0), dtype="float32"), np.empty((0,), dtype="float32")])
+def test_build_from_empty_npz_raises(tmp_path, empty):
+    # (0,) is what save_embeddings wrote for an all-None corpus before it kept the matrix 2-D
+    npz_file = tmp_path / "embeddings.npz"
+    np.savez(npz_file, embeddings=empty,
+             paper_ids=np.asarray([], dtype=str), section_names=np.asarray([], dtype=str))
+
+    with pytest.raises(ValueError, match="No embeddings found"):
+        build_index_from_json(str(npz_file), str(tmp_path / "out"))
+
+
+def test_save_embeddings_keeps_empty_matrix_2d(tmp_path):
+    processor = pytest.importorskip("arxiv_ra.vectorization.processor")
+    npz_file = str(tmp_path / "embeddings.npz")
+
+    processor.save_embeddings({"p1": {"abstract": None}}, npz_file)
+
+    with np.load(npz_file) as data:
+        assert data["embeddings"].ndim == 2
+    assert processor.load_embeddings(npz_file) == {}
+
+
+@pytest.mark.skipif(not hasattr(faiss, "IO_FLAG_MMAP_IFC"), reason="FAISS cannot mmap flat indices")
+@pytest.mark.parametrize("index_type", ["flat", "hnsw"])
+def test_mmapped_index_is_read_only(tmp_path, index_type):
+    manager = filled(tmp_path, index_type)
+    manager.save_index()
+    manager.save_mapping()
+
+    mapped = FAISSManager(str(tmp_path), mmap_index=True)
+    mapped.load_index()
+    mapped.load_mapping()
+
+    assert mapped._mmap_flags() == faiss.IO_FLAG_MMAP_IFC | faiss.IO_FLAG_READ_ONLY
+    with pytest.raises(ValueError, match="read-only"):
+        mapped.add_vectors(vectors(1), ["new"], ["abstract"])
+    with pytest.raises(ValueError, match="read-only"):
+        mapped.remove_paper("p0")
+
+
+def test_mmapped_ivfpq_maps_inverted_lists(tmp_path):
+    filled(tmp_path, "ivfpq", n=400, ivf_nlist=8, pq_m=4).save_index()
+
+    mapped = FAISSManager(str(tmp_path), mmap_index=True)
+
+    assert mapped._mmap_flags() == faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+
+
+def test_mmapped_search_matches_in_memory(tmp_path):
+    manager = filled(tmp_path)
+    manager.save_index()
+    manager.save_mapping()
+    query = vectors(1, seed=9)[0]
+
+    mapped = FAISSManager(str(tmp_path), mmap_index=True)
+
+    assert mapped.search_similar(query, k=3) == manager.search_similar(query, k=3)
@@ -0,0 +1,41 @@
+"""
+Tests for the shared filesystem helpers
+"""
+import pytest
+
+from arxiv_ra.core import fs
+from arxiv_ra.core.fs import ensure_dir
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(fs, "_known_dirs", set())
+
+
+def test_creates_missing_parents(tmp_path):
+    ensure_dir(tmp_path / "a" / "b" / "c")
+    ensure_dir(tmp_path / "a" / "b" / "c")
+
+    assert (tmp_path / "a" / "b" / "c").is_dir()
+
+
+def test_relative_path_is_recreated_after_chdir(tmp_path, monkeypatch):
+    (tmp_path / "one").mkdir()
+    (tmp_path / "two").mkdir()
+
+    monkeypatch.chdir(tmp_path / "one")
+    ensure_dir("data")
+    monkeypatch.chdir(tmp_path / "two")
+    ensure_dir("data")
+
+    assert (tmp_path / "one" / "data").is_dir()
+    assert (tmp_path / "two" / "data").is_dir()
+
+
+def test_existing_file_is_rejected(tmp_path):
+    (tmp_path / "data").write_text("not a directory")
+
+    with pytest.raises(FileExistsError):
+        ensure_dir(tmp_path / "data")
+    with pytest.raises(FileExistsError):
+        ensure_dir(tmp_path / "data")
@@ -0,0 +1,113 @@
+"""
+Tests for RocksDBManager's SQLite fallback and LRU paper cache
+"""
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+pytest.importorskip("orjson")
+
+from arxiv_ra.storage.rocksdb_manager import RocksDBManager
+
+
+@pytest.fixture
+def manager(tmp_path, monkeypatch):
+    # A None entry makes `from rocksdict import Rdict` raise ImportError
+    monkeypatch.setitem(sys.modules, "rocksdict", None)
+    db = RocksDBManager(str(tmp_path / "rocksdb"), cache_size=3)
+    yield db
+    db.close()
+
+
+def paper(i):
+    return {"title": f"Paper {i}", "authors": [f"Author {i}"]}
+
+
+def test_falls_back_to_sqlite(manager, tmp_path):
+    assert manager.db is None
+    assert (tmp_path / "rocksdb.sqlite").exists()
+
+
+def test_store_get_list(manager):
+    manager.store_paper("p1", paper(1))
+    manager.store_multiple({"p2": paper(2), "p3": paper(3)})
+
+    assert manager.get_paper("p1") == paper(1)
+    assert manager.get_paper("missing") is None
+    assert sorted(manager.list_papers()) == ["p1", "p2", "p3"]
+
+
+def test_get_papers_reads_in_chunks(manager):
+    manager.cache_size = 0
+    manager.store_multiple({f"p{i}": paper(i) for i in range(1200)})
+
+    statements = []
+    manager.sql.set_trace_callback(statements.append)
+    ids = [f"p{i}" for i in range(1200)] + ["missing", "p0"]
+    papers = manager.get_papers(ids)
+
+    assert papers[:1200] == [paper(i) for i in range(1200)]
+    assert papers[1200] is None
+    assert papers[1201] == paper(0)
+    # 1201 distinct ids -> chunks of 500 + 500 + 201; traced SQL has the values bound
+    selects = [s for s in statements if s.startswith("SELECT")]
+    assert [s.split(" IN ")[1].count(",") + 1 for s in selects] == [500, 500, 201]
+
+
+def test_lru_evicts_least_recently_used(manager):
+    manager.store_multiple({f"p{i}": paper(i) for i in range(4)})
+    for paper_id in ("p0", "p1", "p2"):
+        manager.get_paper(paper_id)
+    manager.get_paper("p0")
+    manager.get_paper("p3")
+
+    assert list(manager._cache) == ["p2", "p0", "p3"]
+
+
+def test_get_papers_fills_cache(manager):
+    manager.store_multiple({f"p{i}": paper(i) for i in range(3)})
+    manager.get_papers(["p0", "p1", "missing"])
+
+    assert list(manager._cache) == ["p0", "p1"]
+
+
+def test_store_invalidates_cached_paper(manager):
+    manager.store_paper("p1", paper(1))
+    manager.get_paper("p1")
+    manager.store_paper("p1", paper(2))
+    assert manager.get_paper("p1") == paper(2)
+
+    manager.store_multiple({"p1": paper(3)})
+    assert manager.get_papers(["p1"]) == [paper(3)]
+
+
+def test_returned_papers_are_copies(manager):
+    manager.store_paper("p1", paper(1))
+    manager.get_paper("p1")["title"] = "changed"
+    manager.get_papers(["p1"])[0]["authors"].append("someone")
+
+    assert manager.get_paper("p1") == paper(1)
+
+
+def test_concurrent_reads_and_writes(manager):
+    manager.store_multiple({f"p{i}": paper(i) for i in range(20)})
+
+    def work(worker):
+        for i in range(200):
+            paper_id = f"p{(worker + i) % 20}"
+            if i % 7 == 0:
+                manager.store_paper(paper_id, paper(int(paper_id[1:])))
+            assert manager.get_paper(paper_id) == paper(int(paper_id[1:]))
+            manager.get_papers([paper_id, "p0", "missing"])
+
+    # Switch threads as often as possible to shake out check-then-act races
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(work, range(8)))
+    finally:
+        sys.setswitchinterval(interval)
+
+    assert len(manager._cache) <= manager.cache_size
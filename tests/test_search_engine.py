@@ -0,0 +1,122 @@
+"""
+Tests for ArxivSearchEngine's query-embedding cache and batched search
+"""
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("faiss")
+
+from arxiv_ra.search import search_engine
+from arxiv_ra.search.search_engine import ArxivSearchEngine
+from arxiv_ra.storage.faiss_manager import FAISSManager
+from arxiv_ra.storage.rocksdb_manager import RocksDBManager
+
+DIM = 8
+
+
+def query_vector(query):
+    """Deterministic stand-in for a CLIP text embedding"""
+    seed = sum(query.encode("utf-8"))
+    return np.random.default_rng(seed).standard_normal(DIM).astype("float32").tolist()
+
+
+class FakeClip:
+    """Records which queries would have gone through CLIP"""
+
+    def __init__(self):
+        self.encoded = []
+
+    def vectorize_text(self, query):
+        self.encoded.append(query)
+        return query_vector(query)
+
+    def vectorize_texts(self, queries):
+        self.encoded.extend(queries)
+        return [query_vector(query) for query in queries]
+
+
+@pytest.fixture
+def clip(monkeypatch):
+    fake = FakeClip()
+    monkeypatch.setattr(search_engine, "_clip", lambda: fake)
+    return fake
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setitem(sys.modules, "rocksdict", None)
+    papers = {f"p{i}": {"title": f"Paper {i}", "abstract": f"Abstract {i}"} for i in range(6)}
+
+    manager = FAISSManager(str(tmp_path))
+    manager.add_vectors(
+        np.asarray([query_vector(f"topic {i}") for i in range(6)], dtype="float32"),
+        list(papers), ["abstract"] * 6
+    )
+    manager.save_index()
+    manager.save_mapping()
+
+    db = RocksDBManager(str(tmp_path / "rocksdb"))
+    db.store_multiple(papers)
+    db.close()
+    return tmp_path
+
+
+def engine(data_dir, **kwargs):
+    return ArxivSearchEngine(str(data_dir), **kwargs)
+
+
+def test_repeat_query_skips_clip(data_dir, clip):
+    search = engine(data_dir)
+
+    first = search.search_by_text("topic 2", k=1)
+    second = search.search_by_text("topic 2", k=1)
+
+    assert clip.encoded == ["topic 2"]
+    assert first == second
+    assert first[0]["paper_id"] == "p2"
+
+
+def test_query_cache_evicts_least_recently_used(data_dir, clip):
+    search = engine(data_dir, query_cache_size=2)
+
+    for query in ("topic 0", "topic 1", "topic 0", "topic 2", "topic 1", "topic 2"):
+        search.search_by_text(query, k=1)
+
+    # topic 1 was the least recently used entry when topic 2 arrived
+    assert clip.encoded == ["topic 0", "topic 1", "topic 2", "topic 1"]
+
+
+def test_batched_queries_encode_only_misses(data_dir, clip):
+    search = engine(data_dir)
+    search.search_by_text("topic 1", k=1)
+
+    search.search_by_texts(["topic 1", "topic 3", "topic 3", "topic 4"], k=1)
+    search.search_by_text("topic 4", k=1)
+
+    assert clip.encoded == ["topic 1", "topic 3", "topic 4"]
+
+
+def test_disabled_query_cache(data_dir, clip):
+    search = engine(data_dir, query_cache_size=0)
+
+    search.search_by_text("topic 2", k=1)
+    search.search_by_text("topic 2", k=1)
+
+    assert clip.encoded == ["topic 2", "topic 2"]
+
+
+def test_batched_queries_match_single_queries(data_dir, clip):
+    search = engine(data_dir)
+    # A hit without metadata shortens that query's row, shifting every later offset
+    search.rocksdb_manager.sql.execute("DELETE FROM papers WHERE id = 'p1'")
+    queries = ["topic 1", "topic 4", "topic 0"]
+
+    batched = search.search_by_texts(queries, k=3)
+
+    assert batched == [search.search_by_text(query, k=3) for query in queries]
+    assert batched[1][0]["paper_id"] == "p4"
+    assert all(result["paper_id"] != "p1" for results in batched for result in results)
+    assert search.search_by_texts([], k=3) == []
@@ -0,0 +1,129 @@
+"""
+Tests for the .env cache and configuration validation in config.settings
+"""
+import json
+import os
+
+import pytest
+
+pytest.importorskip("dotenv")
+
+from arxiv_ra.config import settings
+
+
+@pytest.fixture
+def env_file(tmp_path, monkeypatch):
+    env = tmp_path / ".env"
+    env.write_text("GREETING=hello\nHOME_DATA=${HOME}/data\n")
+    monkeypatch.setattr(settings, "ENV_FILE", env)
+    monkeypatch.setattr(settings, "ENV_CACHE_FILE", tmp_path / ".env.cache.json")
+    return env
+
+
+def age(path, seconds):
+    stat = path.stat()
+    os.utime(path, (stat.st_atime - seconds, stat.st_mtime - seconds))
+
+
+def test_expand_variables():
+    env = {"NAME": "arxiv"}
+
+    assert settings._expand("${NAME}/data", env) == "arxiv/data"
+    assert settings._expand("${MISSING:-fallback}", env) == "fallback"
+    assert settings._expand("${MISSING}", env) == ""
+    assert settings._expand("$NAME", env) == "$NAME"
+
+
+def test_cache_stores_raw_values_as_json(env_file):
+    values = settings.build_env_cache()
+
+    cached = json.loads(settings.ENV_CACHE_FILE.read_text())
+    assert cached == {"version": settings._ENV_CACHE_VERSION, "values": values}
+    assert values["HOME_DATA"] == "${HOME}/data"
+    assert settings._read_env_cache() == values
+
+
+def test_stale_cache_is_ignored(env_file):
+    settings.build_env_cache()
+    age(settings.ENV_CACHE_FILE, 60)
+
+    assert settings._read_env_cache() is None
+
+
+@pytest.mark.parametrize("content", [
+    json.dumps({"version": -1, "values": {"GREETING": "old"}}).encode(),
+    json.dumps(["not", "a", "cache"]).encode(),
+    b"\x80not json",
+])
+def test_unusable_cache_is_ignored(env_file, content):
+    settings.ENV_CACHE_FILE.write_bytes(content)
+
+    assert settings._read_env_cache() is None
+
+
+def test_load_env_expands_against_current_environment(env_file, monkeypatch):
+    settings.build_env_cache()
+    monkeypatch.setenv("HOME", "/home/alice")
+    monkeypatch.delenv("HOME_DATA", raising=False)
+    monkeypatch.delenv("GREETING", raising=False)
+
+    settings.load_env()
+
+    assert os.environ["HOME_DATA"] == "/home/alice/data"
+    assert os.environ["GREETING"] == "hello"
+
+
+def test_load_env_keeps_existing_variables(env_file, monkeypatch):
+    monkeypatch.setenv("GREETING", "hi")
+    monkeypatch.delenv("HOME_DATA", raising=False)
+
+    settings.load_env()
+
+    assert os.environ["GREETING"] == "hi"
+
+
+def test_numeric_settings_name_the_bad_value(monkeypatch):
+    monkeypatch.setenv("MAX_UPLOAD_SIZE", "abc")
+    monkeypatch.setenv("SIMILARITY_THRESHOLD", "high")
+
+    with pytest.raises(ValueError, match="MAX_UPLOAD_SIZE must be an integer, got 'abc'"):
+        settings._env_int("MAX_UPLOAD_SIZE", 1)
+    with pytest.raises(ValueError, match="SIMILARITY_THRESHOLD must be a number, got 'high'"):
+        settings._env_float("SIMILARITY_THRESHOLD", 0.1)
+    assert settings._env_int("UNSET_NUMERIC_SETTING", 7) == 7
+
+
+@pytest.mark.parametrize("key, value", [
+    ("MAX_UPLOAD_SIZE", 0),
+    ("SIMILARITY_THRESHOLD", 1.5),
+    ("FAISS_INDEX_TYPE", "annoy"),
+    ("LOG_LEVEL", "VERBOSE"),
+])
+def test_schema_rejects_invalid_settings(monkeypatch, key, value):
+    pytest.importorskip("fastjsonschema")
+    monkeypatch.setattr(settings.Config, key, value)
+
+    with pytest.raises(ValueError, match=f"Invalid configuration: .*{key}"):
+        settings.Config.validate_schema()
+
+
+def test_schema_accepts_defaults():
+    pytest.importorskip("fastjsonschema")
+
+    settings.Config.validate_schema()
+
+
+def test_ensure_directories_creates_only_leaves(tmp_path, monkeypatch):
+    calls = []
+    monkeypatch.setattr(settings, "ensure_dir", calls.append)
+    monkeypatch.setattr(settings, "_dirs_ready", False)
+    monkeypatch.setattr(settings.Config, "DATA_DIR", tmp_path / "data")
+    monkeypatch.setattr(settings.Config, "MEDIA_ROOT", str(tmp_path / "data" / "media"))
+    monkeypatch.setattr(settings.Config, "ROCKSDB_PATH", str(tmp_path / "data" / "rocksdb"))
+    monkeypatch.setattr(settings.Config, "LOG_FILE", str(tmp_path / "logs" / "app.log"))
+
+    settings.Config.ensure_directories()
+    settings.Config.ensure_directories()
+
+    # data/ is an ancestor of data/media, so it is created implicitly
+    assert calls == [tmp_path / "logs", tmp_path / "data" / "media"]